@@ -1,81 +1,89 @@
 import os
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 import calendar
 import math
+from functools import lru_cache
 
 COUNTER = 0
 
+LIST_COURTS_SQL = """
+    SELECT DISTINCT(court) AS courts
+    FROM ecli_document
+    WHERE status = 'public'
+    AND country = $1
+    """
+
+LIST_YEARS_SQL = """
+    SELECT DISTINCT(year) AS years
+    FROM ecli_document
+    WHERE status = 'public'
+    AND country = $1
+    AND court = $2
+    """
+
+LIST_DOCUMENTS_SQL = """
+    SELECT identifier AS documents
+    FROM ecli_document
+    WHERE status = 'public'
+    AND country = $1
+    AND court = $2
+    AND year = $3
+    """
+
+
 def check_envs(env_list):
     return all(os.getenv(e) for e in env_list)
 
 
 def get_now():
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
     return calendar.timegm(now.utctimetuple())
 
 
+@lru_cache(maxsize=None)
+def status_base(start_time, version):
+    return {
+        'all_systems': 'nominal',
+        'id': __name__,
+        'online_since': str(start_time),
+        'api_version': version,
+    }
+
+
 def status_get(start_time, version):
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
     delta = now - start_time
     delta_s = math.floor(delta.total_seconds())
     return {
-        'all_systems': 'nominal',
-        'id': __name__,
+        **status_base(start_time, version),
         'timestamp': str(now),
-        'online_since': str(start_time),
         'online_for_seconds': delta_s,
-        'api_version': version,
         'api_counter': COUNTER,
     }
 
 
 async def listCourts(db, country):
-    sql = """
-    SELECT DISTINCT(court) AS courts
-    FROM ecli_document
-    WHERE status = 'public'
-    AND country = $1
-    """
-
-    rows = await db.fetch(sql, country)
+    rows = await db.fetch(LIST_COURTS_SQL, country)
 
     if not rows:
         raise RuntimeError("No results")
 
-    return [x['courts'] for x in rows]
+    return [x[0] for x in rows]
 
 
 async def listYears(db, country, court):
-    sql = """
-    SELECT DISTINCT(year) AS years
-    FROM ecli_document
-    WHERE status = 'public'
-    AND country = $1
-    AND court = $2
-    """
-
-    rows = await db.fetch(sql, country, court)
+    rows = await db.fetch(LIST_YEARS_SQL, country, court)
 
     if not rows:
         raise RuntimeError("No results")
 
-    return [x['years'] for x in rows]
+    return [x[0] for x in rows]
 
 
 async def listDocuments(db, country, court, year):
-    sql = """
-    SELECT identifier AS documents
-    FROM ecli_document
-    WHERE status = 'public'
-    AND country = $1
-    AND court = $2
-    AND year = $3
-    """
-
-    rows = await db.fetch(sql, country, court, year)
+    rows = await db.fetch(LIST_DOCUMENTS_SQL, country, court, year)
 
     if not rows:
         raise RuntimeError("No results")
 
-    return [x['documents'] for x in rows]
+    return [x[0] for x in rows]
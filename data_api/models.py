@@ -1,9 +1,10 @@
+import json
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Any, List
 
-from pydantic import BaseModel, Field, Json, PositiveInt
-from enum import Enum
+import msgspec
+from pydantic import BaseModel, Field, Json, PositiveInt, validator
 
 
 class ListTypes(str, Enum):
@@ -18,6 +19,13 @@ class LanguageTypes(str, Enum):
     DE = 'DE'
 
 
+def decode_meta(v):
+    # Older clients send meta as a JSON encoded string
+    if isinstance(v, (str, bytes)):
+        return json.loads(v)
+    return v
+
+
 class SubmitModel(BaseModel):
     v: PositiveInt = Field(..., alias='_v', description="Version")
     timestamp: datetime = Field(..., alias='_timestamp', description="Timestamp (UNIX Epoch)")
@@ -28,7 +36,11 @@ class SubmitModel(BaseModel):
     text: str = Field(..., description="Content of document")
     lang: LanguageTypes = Field(..., description="Document Language")
     user_key: str = Field(..., description="User key")
-    meta: Json = None
+    meta: Any = Field(None, description="Document metadata (JSON value)")
+
+    @validator('meta', pre=True)
+    def meta_from_json(cls, v):
+        return decode_meta(v)
 
     class Config:
         schema_extra = {
@@ -42,10 +54,31 @@ class SubmitModel(BaseModel):
                 'text': 'Lorem Ipsum ...',
                 'lang': 'NL',
                 'user_key': 'OIJAS-OIQWE',
-                'meta': '{}',
+                'meta': {},
             }}
 
 
+class SubmitStruct(msgspec.Struct):
+    """
+    msgspec mirror of SubmitModel, decodes /create bodies straight from bytes
+    """
+    v: int = msgspec.field(name='_v')
+    timestamp: datetime = msgspec.field(name='_timestamp')
+    country: str
+    court: str
+    year: int
+    identifier: str
+    text: str
+    lang: LanguageTypes
+    user_key: str
+    meta: Any = None
+
+    def __post_init__(self):
+        if self.v <= 0:
+            raise ValueError("_v must be a positive integer")
+        self.meta = decode_meta(self.meta)
+
+
 class ReadModel(BaseModel):
     v: PositiveInt = Field(..., alias='_v', description="Version")
     timestamp: datetime = Field(..., alias='_timestamp', description="Timestamp (UNIX Epoch)")